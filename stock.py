@@ -1,18 +1,234 @@
+import atexit
+import csv
+import io
+import math
 import sqlite3
-from datetime import datetime
+import sys
+import threading
+import weakref
 
 DB_FILE = "inventory.db"
+MAX_POOL_SIZE = 8  # reserved for read scaling (1 writer + N readers); not enforced yet
+CACHED_STATEMENTS = 256  # per-connection prepared-statement cache size
+REPORT_BATCH_SIZE = 1000  # rows fetched and written per chunk in reports
+
+# Fixed report line layouts, filled with a single %-format per plain tuple row.
+_SUPPLIER_FMT = "ID: %s | Name: %s | Contact: %s"
+_PRODUCT_FMT = "ID: %s | Name: %s | Cat: %s | Qty: %s | Price: %s | Supplier: %s"
+_LOW_STOCK_FMT = "ID: %s | Name: %s | Qty: %s"
+_TRANSACTION_FMT = "TransID: %s | ProdID: %s | Product: %s | Type: %s | Qty: %s | Date: %s"
+_STOCK_MOVEMENT_FMT = "ID: %s | Name: %s | Total IN: %s | Total OUT: %s | Last Txn: %s"
+
+_pool = threading.local()
+_pool_conns = weakref.WeakSet()
+_pool_lock = threading.Lock()
+
+_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",      # ~64 MB page cache
+    "PRAGMA mmap_size = 268435456",    # 256 MB memory-mapped I/O
+)
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3.Connection subclass so pooled connections can be weak-referenced."""
+    tuned = False
+    closed = False
+    product_listing = None  # (change state, rendered text) cached by show_product_listing()
+
+    def close(self):
+        self.closed = True
+        super().close()
+
+# ---------------------------
+# SQL Statements
+# ---------------------------
+# Kept as module-level constants so every call reuses the same statement
+# text and hits the connection's prepared-statement cache.
+SQL_CREATE_SUPPLIERS = """
+    CREATE TABLE IF NOT EXISTS Suppliers (
+        supplier_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        contact TEXT
+    )
+"""
+SQL_CREATE_PRODUCTS = """
+    CREATE TABLE IF NOT EXISTS Products (
+        product_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        category TEXT,
+        quantity INTEGER NOT NULL,
+        price REAL NOT NULL,
+        supplier_id INTEGER,
+        FOREIGN KEY(supplier_id) REFERENCES Suppliers(supplier_id)
+    )
+"""
+SQL_CREATE_TRANSACTIONS = """
+    CREATE TABLE IF NOT EXISTS Transactions (
+        trans_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        product_id INTEGER,
+        trans_type TEXT CHECK(trans_type IN ('IN','OUT')),
+        quantity INTEGER NOT NULL,
+        date TEXT DEFAULT (datetime('now', 'localtime')),
+        FOREIGN KEY(product_id) REFERENCES Products(product_id)
+    )
+"""
+SQL_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_trans_product ON Transactions(product_id)",
+    "CREATE INDEX IF NOT EXISTS idx_trans_date ON Transactions(date DESC, trans_id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_products_qty ON Products(quantity)",
+)
+# Per-product running totals, kept current by a trigger on Transactions so
+# aggregate reports never need to scan the transaction history.
+SQL_CREATE_PRODUCT_STATS = """
+    CREATE TABLE IF NOT EXISTS ProductStats (
+        product_id INTEGER PRIMARY KEY,
+        last_txn_date TEXT,
+        total_in INTEGER NOT NULL DEFAULT 0,
+        total_out INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY(product_id) REFERENCES Products(product_id)
+    )
+"""
+SQL_DROP_PRODUCT_STATS_TRIGGER = "DROP TRIGGER IF EXISTS trg_transactions_stats"
+SQL_CREATE_PRODUCT_STATS_TRIGGER = """
+    CREATE TRIGGER trg_transactions_stats
+    AFTER INSERT ON Transactions
+    WHEN NEW.product_id IS NOT NULL
+    BEGIN
+        INSERT INTO ProductStats (product_id, last_txn_date, total_in, total_out)
+        VALUES (NEW.product_id, NEW.date,
+                CASE NEW.trans_type WHEN 'IN' THEN NEW.quantity ELSE 0 END,
+                CASE NEW.trans_type WHEN 'OUT' THEN NEW.quantity ELSE 0 END)
+        ON CONFLICT(product_id) DO UPDATE SET
+            last_txn_date = coalesce(max(last_txn_date, excluded.last_txn_date),
+                                     last_txn_date, excluded.last_txn_date),
+            total_in = total_in + excluded.total_in,
+            total_out = total_out + excluded.total_out;
+    END
+"""
+# Rebuilds the totals from history; run with the schema so upgraded databases start in sync.
+# Transactions whose product no longer exists are skipped to satisfy the foreign key.
+SQL_REBUILD_PRODUCT_STATS = """
+    INSERT OR REPLACE INTO ProductStats (product_id, last_txn_date, total_in, total_out)
+    SELECT t.product_id, max(t.date),
+           sum(CASE t.trans_type WHEN 'IN' THEN t.quantity ELSE 0 END),
+           sum(CASE t.trans_type WHEN 'OUT' THEN t.quantity ELSE 0 END)
+    FROM Transactions t
+    JOIN Products p ON p.product_id = t.product_id
+    GROUP BY t.product_id
+"""
+# Bump SCHEMA_VERSION whenever the DDL above changes so existing databases pick it up.
+SCHEMA_VERSION = 3
+SQL_SCHEMA_VERSION = "PRAGMA user_version"
+SQL_DATA_VERSION = "PRAGMA data_version"
+SQL_CREATE_SCHEMA = ";\n".join((
+    "BEGIN",
+    SQL_CREATE_SUPPLIERS,
+    SQL_CREATE_PRODUCTS,
+    SQL_CREATE_TRANSACTIONS,
+    *SQL_CREATE_INDEXES,
+    SQL_CREATE_PRODUCT_STATS,
+    SQL_DROP_PRODUCT_STATS_TRIGGER,
+    SQL_CREATE_PRODUCT_STATS_TRIGGER,
+    SQL_REBUILD_PRODUCT_STATS,
+    f"PRAGMA user_version = {SCHEMA_VERSION}",
+    "COMMIT",
+)) + ";"
+
+SQL_BEGIN = "BEGIN IMMEDIATE"
+
+SQL_INSERT_SUPPLIER = "INSERT INTO Suppliers (name, contact) VALUES (?, ?)"
+SQL_LIST_SUPPLIERS = "SELECT supplier_id, name, coalesce(nullif(contact, ''), '-') FROM Suppliers ORDER BY supplier_id"
+
+SQL_INSERT_PRODUCT = "INSERT INTO Products (name, category, quantity, price, supplier_id) VALUES (?, ?, ?, ?, ?)"
+SQL_LIST_PRODUCTS = """
+    SELECT p.product_id, p.name, coalesce(nullif(p.category, ''), '-'), p.quantity, p.price,
+           coalesce(s.name || ' (ID:' || s.supplier_id || ')', '-')
+    FROM Products p
+    LEFT JOIN Suppliers s ON p.supplier_id = s.supplier_id
+    ORDER BY p.product_id
+"""
+SQL_GET_PRODUCT = "SELECT * FROM Products WHERE product_id=?"
+SQL_INC_QTY = "UPDATE Products SET quantity = quantity + ? WHERE product_id=?"
+SQL_DEC_QTY = "UPDATE Products SET quantity = quantity - ? WHERE product_id=?"
+
+# The timestamp is generated by SQLite rather than passed in; it is spelled out
+# here as well as in the column default so databases created before the
+# default existed still get a date.
+SQL_INSERT_TX_IN = ("INSERT INTO Transactions (product_id, trans_type, quantity, date) "
+                    "VALUES (?, 'IN', ?, datetime('now', 'localtime'))")
+SQL_INSERT_TX_OUT = ("INSERT INTO Transactions (product_id, trans_type, quantity, date) "
+                     "VALUES (?, 'OUT', ?, datetime('now', 'localtime'))")
+SQL_LOW_STOCK = "SELECT product_id, name, quantity FROM Products WHERE quantity <= ? ORDER BY quantity"
+SQL_LIST_TRANSACTIONS = """
+    SELECT t.trans_id, t.product_id, coalesce(nullif(p.name, ''), '-'), t.trans_type, t.quantity, t.date
+    FROM Transactions t
+    LEFT JOIN Products p ON t.product_id = p.product_id
+    ORDER BY t.date DESC, t.trans_id DESC
+"""
+SQL_STOCK_MOVEMENT = """
+    SELECT p.product_id, p.name, coalesce(st.total_in, 0), coalesce(st.total_out, 0),
+           coalesce(st.last_txn_date, '-')
+    FROM Products p
+    LEFT JOIN ProductStats st ON st.product_id = p.product_id
+    ORDER BY p.product_id
+"""
+SQL_MAX_DATE_LENGTH = "SELECT max(length(date)) FROM Transactions WHERE product_id IS NOT NULL"
+SQL_TRANSACTION_COLUMNS = """
+    SELECT product_id, trans_type, quantity, coalesce(date, '')
+    FROM Transactions
+    WHERE product_id IS NOT NULL
+    ORDER BY trans_id
+"""
 
 # ---------------------------
 # Helpers
 # ---------------------------
 def get_connection():
-    """Return a sqlite3 connection with row factory and foreign keys enabled."""
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    """Return this thread's pooled sqlite3 connection, (re)opening it when needed."""
+    conn = getattr(_pool, "conn", None)
+    if conn is None or conn.closed:
+        conn = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None,
+                               factory=_PooledConnection, cached_statements=CACHED_STATEMENTS)
+        with _pool_lock:
+            _pool_conns.add(conn)
+        _pool.conn = conn
+    _tune_connection(conn)
     return conn
 
+def _tune_connection(conn):
+    """Apply WAL and performance PRAGMAs once per connection; later calls are a no-op."""
+    if conn.tuned:
+        return
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    conn.tuned = True
+
+def close_pool():
+    """Close every pooled connection; each thread reopens its own on next use."""
+    with _pool_lock:
+        conns = list(_pool_conns)
+        _pool_conns.clear()
+    for conn in conns:
+        conn.close()
+    _pool.conn = None
+
+atexit.register(close_pool)
+
+def _is_foreign_key_error(e):
+    """True if `e` is SQLite rejecting a row for a missing foreign-key parent."""
+    return isinstance(e, sqlite3.IntegrityError) and "FOREIGN KEY constraint failed" in str(e)
+
+def write_rows(first, cursor, format_row, out=None):
+    """Stream `first` and the remaining cursor rows to `out` (default stdout), one write per fetchmany() batch."""
+    write = (out or sys.stdout).write
+    batch = [first]
+    while batch:
+        write("\n".join(map(format_row, batch)) + "\n")
+        batch = cursor.fetchmany(REPORT_BATCH_SIZE)
+
 def input_int(prompt, allow_empty=False):
     """Prompt for an integer, repeat until valid or empty allowed."""
     while True:
@@ -37,42 +253,16 @@ def input_float(prompt):
 # Table Creation
 # ---------------------------
 def create_tables():
+    """Create the schema in one script, skipping it when the database is already current."""
     conn = get_connection()
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Suppliers (
-                supplier_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                contact TEXT
-            )
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Products (
-                product_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                category TEXT,
-                quantity INTEGER NOT NULL,
-                price REAL NOT NULL,
-                supplier_id INTEGER,
-                FOREIGN KEY(supplier_id) REFERENCES Suppliers(supplier_id)
-            )
-        """)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Transactions (
-                trans_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                product_id INTEGER,
-                trans_type TEXT CHECK(trans_type IN ('IN','OUT')),
-                quantity INTEGER NOT NULL,
-                date TEXT,
-                FOREIGN KEY(product_id) REFERENCES Products(product_id)
-            )
-        """)
-        conn.commit()
+        if conn.execute(SQL_SCHEMA_VERSION).fetchone()[0] >= SCHEMA_VERSION:
+            return
+        conn.executescript(SQL_CREATE_SCHEMA)
     except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.rollback()
         print("DB Error on create_tables:", e)
-    finally:
-        conn.close()
 
 # ---------------------------
 # Supplier Management
@@ -87,38 +277,24 @@ def add_supplier():
 
     conn = get_connection()
     try:
-        conn.execute("INSERT INTO Suppliers (name, contact) VALUES (?, ?)", (name, contact))
+        conn.execute(SQL_INSERT_SUPPLIER, (name, contact))
         conn.commit()
         print(f"✅ Supplier '{name}' added.")
     except sqlite3.Error as e:
         print("DB Error adding supplier:", e)
-    finally:
-        conn.close()
 
 def view_suppliers():
     conn = get_connection()
     try:
-        rows = conn.execute("SELECT supplier_id, name, contact FROM Suppliers ORDER BY supplier_id").fetchall()
-        if not rows:
+        cursor = conn.execute(SQL_LIST_SUPPLIERS)
+        first = cursor.fetchone()
+        if first is None:
             print("ℹ️ No suppliers found.")
             return
         print("\n📋 Suppliers:")
-        for r in rows:
-            print(f"ID: {r['supplier_id']} | Name: {r['name']} | Contact: {r['contact'] or '-'}")
+        write_rows(first, cursor, _SUPPLIER_FMT.__mod__)
     except sqlite3.Error as e:
         print("DB Error viewing suppliers:", e)
-    finally:
-        conn.close()
-
-def supplier_exists(supplier_id):
-    if supplier_id is None:
-        return False
-    conn = get_connection()
-    try:
-        row = conn.execute("SELECT 1 FROM Suppliers WHERE supplier_id=?", (supplier_id,)).fetchone()
-        return bool(row)
-    finally:
-        conn.close()
 
 # ---------------------------
 # Product Management
@@ -139,58 +315,109 @@ def add_product():
     view_suppliers()
     supplier_id = input_int("Enter supplier ID (or press Enter to skip): ", allow_empty=True)
 
-    if supplier_id is not None and not supplier_exists(supplier_id):
-        print("⚠️ Supplier ID does not exist. Use existing supplier or add a new one.")
-        return
-
     conn = get_connection()
     try:
-        conn.execute(
-            "INSERT INTO Products (name, category, quantity, price, supplier_id) VALUES (?, ?, ?, ?, ?)",
-            (name, category, quantity, price, supplier_id)
-        )
+        conn.execute(SQL_INSERT_PRODUCT, (name, category, quantity, price, supplier_id))
         conn.commit()
         print(f"📦 Product '{name}' added successfully.")
     except sqlite3.Error as e:
-        print("DB Error adding product:", e)
-    finally:
-        conn.close()
+        # foreign_keys=ON rejects an unknown supplier_id, so no separate lookup is needed
+        if supplier_id is not None and _is_foreign_key_error(e):
+            print("⚠️ Supplier ID does not exist. Use existing supplier or add a new one.")
+        else:
+            print("DB Error adding product:", e)
 
-def view_products():
+def view_products(out=None):
+    """Print the product list to `out` (default stdout); return False if the query failed."""
     conn = get_connection()
     try:
-        rows = conn.execute("""
-            SELECT p.product_id, p.name, p.category, p.quantity, p.price,
-                   s.supplier_id, s.name AS supplier_name
-            FROM Products p
-            LEFT JOIN Suppliers s ON p.supplier_id = s.supplier_id
-            ORDER BY p.product_id
-        """).fetchall()
-        if not rows:
-            print("ℹ️ No products found.")
-            return
-        print("\n📋 Products:")
-        for r in rows:
-            supplier = f"{r['supplier_name']} (ID:{r['supplier_id']})" if r['supplier_name'] else "-"
-            print(f"ID: {r['product_id']} | Name: {r['name']} | Cat: {r['category'] or '-'} | Qty: {r['quantity']} | Price: {r['price']} | Supplier: {supplier}")
+        cursor = conn.execute(SQL_LIST_PRODUCTS)
+        first = cursor.fetchone()
+        if first is None:
+            print("ℹ️ No products found.", file=out)
+            return True
+        print("\n📋 Products:", file=out)
+        write_rows(first, cursor, _PRODUCT_FMT.__mod__, out)
+        return True
     except sqlite3.Error as e:
-        print("DB Error viewing products:", e)
-    finally:
-        conn.close()
+        print("DB Error viewing products:", e, file=out)
+        return False
+
+def bulk_add_products(path):
+    """Import products from a CSV file in one transaction; return the number added.
+
+    The file needs a header row with name, category, quantity, price and
+    supplier_id columns (category and supplier_id may be blank). Invalid rows
+    are reported and skipped.
+    """
+    rows = []
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for rec in reader:
+                try:
+                    name = rec["name"].strip()
+                    quantity = int(rec["quantity"])
+                    price = float(rec["price"])
+                    supplier = (rec.get("supplier_id") or "").strip()
+                    supplier_id = int(supplier) if supplier else None
+                    valid = bool(name) and quantity >= 0 and math.isfinite(price)
+                except (KeyError, AttributeError, TypeError, ValueError):
+                    valid = False
+                if not valid:
+                    print(f"⚠️ Line {reader.line_num}: invalid product row skipped.")
+                    continue
+                category = (rec.get("category") or "").strip() or None
+                rows.append((name, category, quantity, price, supplier_id))
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        print(f"⚠️ Could not read CSV file {path}:", e)
+        return 0
+    if not rows:
+        return 0
 
-def get_product(product_id):
     conn = get_connection()
     try:
-        return conn.execute("SELECT * FROM Products WHERE product_id=?", (product_id,)).fetchone()
-    finally:
-        conn.close()
+        conn.execute(SQL_BEGIN)
+        with conn:
+            conn.executemany(SQL_INSERT_PRODUCT, rows)
+        print(f"📦 Imported {len(rows)} products.")
+        return len(rows)
+    except sqlite3.Error as e:
+        if _is_foreign_key_error(e):
+            print("⚠️ Import aborted: a supplier ID does not exist.")
+        else:
+            print("DB Error on bulk_add_products:", e)
+    return 0
+
+def show_product_listing():
+    """Print the product list, reusing the last render while the database is unchanged.
+
+    total_changes covers writes made on this connection and data_version
+    covers commits from any other connection.
+    """
+    conn = get_connection()
+    state = (conn.total_changes, conn.execute(SQL_DATA_VERSION).fetchone()[0])
+    if conn.product_listing is not None and conn.product_listing[0] == state:
+        sys.stdout.write(conn.product_listing[1])
+        return
+    buf = io.StringIO()
+    ok = view_products(buf)
+    # Only a successful render is cached; errors are shown once, never replayed.
+    conn.product_listing = (state, buf.getvalue()) if ok else None
+    sys.stdout.write(buf.getvalue())
+
+def get_product(product_id):
+    """Return the product as a sqlite3.Row (named access), or None."""
+    cursor = get_connection().cursor()
+    cursor.row_factory = sqlite3.Row
+    return cursor.execute(SQL_GET_PRODUCT, (product_id,)).fetchone()
 
 # ---------------------------
 # Stock Transactions
 # ---------------------------
 def stock_in():
     print("\n--- Stock IN ---")
-    view_products()
+    show_product_listing()
     product_id = input_int("Enter product ID to add stock to: ")
     product = get_product(product_id)
     if not product:
@@ -203,19 +430,17 @@ def stock_in():
 
     conn = get_connection()
     try:
-        conn.execute("UPDATE Products SET quantity = quantity + ? WHERE product_id=?", (qty, product_id))
-        conn.execute("INSERT INTO Transactions (product_id, trans_type, quantity, date) VALUES (?, 'IN', ?, ?)",
-                     (product_id, qty, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-        conn.commit()
+        conn.execute(SQL_BEGIN)
+        with conn:
+            conn.execute(SQL_INC_QTY, (qty, product_id))
+            conn.execute(SQL_INSERT_TX_IN, (product_id, qty))
         print(f"✅ Stock updated: +{qty} to '{product['name']}' (ID: {product_id}).")
     except sqlite3.Error as e:
         print("DB Error on stock_in:", e)
-    finally:
-        conn.close()
 
 def stock_out():
     print("\n--- Stock OUT ---")
-    view_products()
+    show_product_listing()
     product_id = input_int("Enter product ID to remove stock from: ")
     product = get_product(product_id)
     if not product:
@@ -232,15 +457,35 @@ def stock_out():
 
     conn = get_connection()
     try:
-        conn.execute("UPDATE Products SET quantity = quantity - ? WHERE product_id=?", (qty, product_id))
-        conn.execute("INSERT INTO Transactions (product_id, trans_type, quantity, date) VALUES (?, 'OUT', ?, ?)",
-                     (product_id, qty, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-        conn.commit()
+        conn.execute(SQL_BEGIN)
+        with conn:
+            conn.execute(SQL_DEC_QTY, (qty, product_id))
+            conn.execute(SQL_INSERT_TX_OUT, (product_id, qty))
         print(f"✅ Stock decreased: -{qty} from '{product['name']}' (ID: {product_id}).")
     except sqlite3.Error as e:
         print("DB Error on stock_out:", e)
-    finally:
-        conn.close()
+
+def stock_in_bulk(rows):
+    """Apply many (product_id, qty) stock-IN rows in one transaction; return rows applied.
+
+    The whole batch is rejected if any qty is not a positive integer.
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    if not all(type(qty) is int and qty > 0 for _, qty in rows):
+        print("⚠️ Quantity must be a positive integer.")
+        return 0
+    conn = get_connection()
+    try:
+        conn.execute(SQL_BEGIN)
+        with conn:
+            conn.executemany(SQL_INC_QTY, ((qty, pid) for pid, qty in rows))
+            conn.executemany(SQL_INSERT_TX_IN, rows)
+        return len(rows)
+    except sqlite3.Error as e:
+        print("DB Error on stock_in_bulk:", e)
+        return 0
 
 # ---------------------------
 # Reports
@@ -253,70 +498,97 @@ def low_stock_report():
         return
     conn = get_connection()
     try:
-        rows = conn.execute("SELECT product_id, name, quantity FROM Products WHERE quantity <= ? ORDER BY quantity", (threshold,)).fetchall()
-        if not rows:
+        cursor = conn.execute(SQL_LOW_STOCK, (threshold,))
+        first = cursor.fetchone()
+        if first is None:
             print("✅ No products with quantity <= threshold.")
             return
         print("\n⚠️ Low Stock Products:")
-        for r in rows:
-            print(f"ID: {r['product_id']} | Name: {r['name']} | Qty: {r['quantity']}")
+        write_rows(first, cursor, _LOW_STOCK_FMT.__mod__)
     except sqlite3.Error as e:
         print("DB Error on low_stock_report:", e)
-    finally:
-        conn.close()
 
 def transaction_report():
     print("\n--- Transactions Report ---")
     conn = get_connection()
     try:
-        rows = conn.execute("""
-            SELECT t.trans_id, t.product_id, p.name AS product_name, t.trans_type, t.quantity, t.date
-            FROM Transactions t
-            LEFT JOIN Products p ON t.product_id = p.product_id
-            ORDER BY t.date DESC, t.trans_id DESC
-        """).fetchall()
-        if not rows:
+        cursor = conn.execute(SQL_LIST_TRANSACTIONS)
+        first = cursor.fetchone()
+        if first is None:
             print("ℹ️ No transactions found.")
             return
         print("\n📊 Transactions:")
-        for r in rows:
-            print(f"TransID: {r['trans_id']} | ProdID: {r['product_id']} | Product: {r['product_name'] or '-'} | Type: {r['trans_type']} | Qty: {r['quantity']} | Date: {r['date']}")
+        write_rows(first, cursor, _TRANSACTION_FMT.__mod__)
     except sqlite3.Error as e:
         print("DB Error on transaction_report:", e)
-    finally:
-        conn.close()
+
+def stock_movement_report():
+    print("\n--- Stock Movement Report ---")
+    conn = get_connection()
+    try:
+        cursor = conn.execute(SQL_STOCK_MOVEMENT)
+        first = cursor.fetchone()
+        if first is None:
+            print("ℹ️ No products found.")
+            return
+        print("\n📈 Stock Movement per Product:")
+        write_rows(first, cursor, _STOCK_MOVEMENT_FMT.__mod__)
+    except sqlite3.Error as e:
+        print("DB Error on stock_movement_report:", e)
+
+def transactions_dataframe():
+    """Return transactions as a dict of NumPy column arrays for analytics.
+
+    Keys are product_id, trans_type, quantity and date. Transactions without a
+    product_id are left out, since the product_id column is int64; missing dates
+    come back as empty strings. NumPy (>= 1.23) is only needed for this function,
+    so it is imported here rather than at module level.
+    For example, stock received per product is
+    ``np.bincount(cols["product_id"], weights=cols["quantity"] * (cols["trans_type"] == "IN"))``.
+    """
+    import numpy as np
+
+    conn = get_connection()
+    # Size the date column from the data so longer values are never truncated.
+    date_width = conn.execute(SQL_MAX_DATE_LENGTH).fetchone()[0] or 1
+    dtype = [("product_id", np.int64), ("trans_type", "U3"), ("quantity", np.int64), ("date", f"U{date_width}")]
+    table = np.fromiter(conn.execute(SQL_TRANSACTION_COLUMNS), dtype=dtype)
+    return {name: table[name] for name in table.dtype.names}
 
 # ---------------------------
 # Menu System
 # ---------------------------
+# Choosing MENU_KEYS[i] runs ACTIONS[i]; "9" is Exit and handled in main_menu().
+MENU_KEYS = ("1", "2", "3", "4", "5", "6", "7", "8", "10")
+ACTIONS = (
+    add_supplier,
+    view_suppliers,
+    add_product,
+    view_products,
+    stock_in,
+    stock_out,
+    low_stock_report,
+    transaction_report,
+    stock_movement_report,
+)
+
 def main_menu():
     create_tables()
     print("===== 📦 Inventory Management System =====")
 
-    actions = {
-        "1": add_supplier,
-        "2": view_suppliers,
-        "3": add_product,
-        "4": view_products,
-        "5": stock_in,
-        "6": stock_out,
-        "7": low_stock_report,
-        "8": transaction_report,
-    }
-
     while True:
         print("\n1. Add Supplier\n2. View Suppliers\n3. Add Product\n4. View Products")
-        print("5. Stock IN\n6. Stock OUT\n7. Low Stock Report\n8. Transaction Report\n9. Exit")
+        print("5. Stock IN\n6. Stock OUT\n7. Low Stock Report\n8. Transaction Report")
+        print("10. Stock Movement Report\n9. Exit")
         choice = input("Enter choice: ").strip()
 
         if choice == "9":
             print("👋 Goodbye!")
             break
-        action = actions.get(choice)
-        if action:
-            action()
+        if choice in MENU_KEYS:
+            ACTIONS[MENU_KEYS.index(choice)]()
         else:
-            print("⚠️ Invalid choice. Please enter a number from 1 to 9.")
+            print("⚠️ Invalid choice. Please enter a number from 1 to 10.")
 
 if __name__ == "__main__":
     main_menu()